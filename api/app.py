@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import inspect
+import math
+import os
+import re
+from bisect import bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Callable
 
 import pandas as pd
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from starlette.concurrency import run_in_threadpool
 
 from src.forecast import forecast_signal
 from src.cancellation_risk import compute_cancellation_risk_table, lookup_cancellation_risk
@@ -16,9 +29,16 @@ from src.price_insights import compute_booking_window_table, compute_expected_ad
 from src.config import DEFAULT_CONFIG
 from src.utils import get_project_root
 from src.logger import logger
+from api.shared_tables import SHM_ENV, load_shared_data
+
+
+# Build validators at class definition and keep payloads immutable once parsed.
+PAYLOAD_CONFIG = ConfigDict(defer_build=False, extra="ignore", frozen=True)
 
 
 class RecommendPayload(BaseModel):
+    model_config = PAYLOAD_CONFIG
+
     city: str | None = None
     budget: float | None = None
     min_rating: float | None = None
@@ -33,6 +53,8 @@ class RecommendPayload(BaseModel):
 
 
 class ForecastSignalPayload(BaseModel):
+    model_config = PAYLOAD_CONFIG
+
     city: str
     hotel_class: float | None = None
     check_in_date: str
@@ -40,12 +62,16 @@ class ForecastSignalPayload(BaseModel):
 
 
 class CancellationRiskPayload(BaseModel):
+    model_config = PAYLOAD_CONFIG
+
     hotel_type: str
     market_segment: str
     lead_time: int
 
 
 class OverbookingRiskPayload(BaseModel):
+    model_config = PAYLOAD_CONFIG
+
     hotel_type: str
     arrival_month: str
     market_segment: str | None = None
@@ -54,6 +80,8 @@ class OverbookingRiskPayload(BaseModel):
 
 
 class PriceFairnessPayload(BaseModel):
+    model_config = PAYLOAD_CONFIG
+
     hotel_type: str
     arrival_month: str
     current_price: float
@@ -61,12 +89,33 @@ class PriceFairnessPayload(BaseModel):
 
 
 class BestBookingWindowPayload(BaseModel):
+    model_config = PAYLOAD_CONFIG
+
     hotel_type: str
     arrival_month: str
     min_samples: int = 200
 
 
-app = FastAPI(title="Travel Hotel Recommender")
+class BatchOp(BaseModel):
+    model_config = PAYLOAD_CONFIG
+
+    endpoint: str
+    payload: dict[str, Any] = {}
+
+
+# Upper bound on ops per /batch call so one request can't flood the threadpool.
+MAX_BATCH_OPS = 8
+
+
+class BatchPayload(BaseModel):
+    model_config = PAYLOAD_CONFIG
+
+    ops: list[BatchOp] = Field(max_length=MAX_BATCH_OPS)
+
+
+app = FastAPI(title="Travel Hotel Recommender", default_response_class=ORJSONResponse)
+# Middleware added last runs outermost, so GZip goes first to keep CORS on the outside.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -75,41 +124,315 @@ app.add_middleware(
     allow_headers=["*"]
 )
 
+
+def _bucket_bounds(label: Any) -> tuple[int, float] | None:
+    """Return the inclusive integer (low, high) range covered by a lead-time bucket label."""
+    if isinstance(label, pd.Interval):
+        # Open-ended pd.cut edges (e.g. (365, inf]) can't go through floor/ceil.
+        if math.isinf(label.left):
+            low = 0
+        else:
+            low = math.ceil(label.left) if label.closed_left else math.floor(label.left) + 1
+        if math.isinf(label.right):
+            high = math.inf
+        else:
+            high = math.floor(label.right) if label.closed_right else math.ceil(label.right) - 1
+        return (int(low), float(high))
+    text = str(label)
+    match = re.match(r"^\s*(\d+)\s*-\s*(\d+)", text)
+    if match:
+        return (int(match.group(1)), float(match.group(2)))
+    match = re.match(r"^\s*(\d+)\s*\+", text)
+    if match:
+        return (int(match.group(1)), math.inf)
+    return None
+
+
+def _build_cancellation_index(table: pd.DataFrame) -> tuple[list[tuple[int, float]], dict[tuple, Any]]:
+    """Precompute cancellation risk results keyed by (hotel, market_segment, bucket_low)."""
+    required = {"hotel", "market_segment", "lead_time_bucket"}
+    if table is None or table.empty or not required.issubset(table.columns):
+        return [], {}
+
+    buckets = {}
+    for label in table["lead_time_bucket"].dropna().unique():
+        bounds = _bucket_bounds(label)
+        if bounds is None:
+            # Unknown bucket format: leave the index empty and use the pandas lookup.
+            return [], {}
+        buckets[bounds[0]] = bounds
+
+    index: dict[tuple, Any] = {}
+    for hotel, segment, label in table[["hotel", "market_segment", "lead_time_bucket"]].drop_duplicates().itertuples(index=False):
+        bounds = _bucket_bounds(label)
+        if bounds is None:
+            continue
+        risk = lookup_cancellation_risk(
+            risk_table=table,
+            hotel_type=str(hotel),
+            market_segment=str(segment),
+            lead_time=bounds[0],
+        )
+        if risk is not None:
+            index[(str(hotel), str(segment), bounds[0])] = risk
+    return [buckets[low] for low in sorted(buckets)], index
+
+
+def _load_or_build(name: str, compute: Callable[[pd.DataFrame], pd.DataFrame], bookings: pd.DataFrame) -> pd.DataFrame:
+    """Load a derived table from data/derived if it is newer than its inputs, else compute and store it.
+
+    The inputs are the raw bookings file and the module defining ``compute``, so a changed
+    builder invalidates its cached table. A table is only cached if reading the file back gives
+    an equal frame (same dtypes included); e.g. interval bucket columns that parquet can't
+    reproduce are recomputed on every start instead of being served in a different form.
+    """
+    out = DERIVED_DIR / f"{name}.parquet"
+    deps = [d for d in BOOKINGS_SOURCES if d.exists()]
+    if deps:
+        deps.append(Path(inspect.getfile(compute)))
+    if deps and out.exists() and out.stat().st_mtime > max(d.stat().st_mtime for d in deps):
+        try:
+            return pd.read_parquet(out)
+        except Exception as e:
+            logger.warning("Could not read %s, rebuilding: %s", out, e)
+
+    table = compute(bookings)
+    if deps:
+        # Write then rename so concurrent workers never read a partial file.
+        tmp = out.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            out.parent.mkdir(parents=True, exist_ok=True)
+            table.to_parquet(tmp)
+            if not pd.read_parquet(tmp).equals(table):
+                raise ValueError("table does not round-trip through parquet")
+            os.replace(tmp, out)
+        except Exception as e:
+            logger.warning("Could not write %s: %s", out, e)
+            tmp.unlink(missing_ok=True)
+    return table
+
+
+def _build_cancellation_state(bookings: pd.DataFrame) -> tuple[pd.DataFrame, list[tuple[int, float]], list[int], dict[tuple, Any]]:
+    table = _load_or_build("cancellation_risk", compute_cancellation_risk_table, bookings)
+    # The index is only an accelerator: if it can't be built, lookups go to the table.
+    try:
+        buckets, index = _build_cancellation_index(table)
+    except Exception as e:
+        logger.warning("Could not build cancellation index, using table lookups: %s", e, exc_info=True)
+        buckets, index = [], {}
+    return table, buckets, [low for low, _ in buckets], index
+
+
+async def _table_ready(future: Future) -> None:
+    """Wait for a background table build without blocking the event loop."""
+    if not future.done():
+        await asyncio.wrap_future(future)
+
+
+def _log_table_failure(future: Future) -> None:
+    if future.exception() is not None:
+        logger.error("Failed to build table: %s", future.exception(), exc_info=future.exception())
+
+
+def _cancellation_bucket(buckets: list[tuple[int, float]], lows: list[int], lead_time: int | None) -> int | None:
+    if lead_time is None or not buckets:
+        return None
+    pos = bisect_right(lows, int(lead_time)) - 1
+    if pos < 0 or int(lead_time) > buckets[pos][1]:
+        return None
+    return buckets[pos][0]
+
+
+def _lookup_cancellation(hotel_type: str | None, market_segment: str | None, lead_time: int | None) -> Any:
+    """Cancellation risk via the startup hash index, falling back to the table lookup on a miss."""
+    table, buckets, lows, index = CANCELLATION_FUT.result()
+    bucket = _cancellation_bucket(buckets, lows, lead_time)
+    if bucket is not None:
+        risk = index.get((hotel_type, market_segment, bucket))
+        if risk is not None:
+            return risk
+    return lookup_cancellation_risk(
+        risk_table=table,
+        hotel_type=hotel_type,
+        market_segment=market_segment,
+        lead_time=lead_time,
+    )
+
+
+def _lookup_overbooking(
+    hotel_type: str,
+    arrival_month: str,
+    market_segment: str | None,
+    is_repeated_guest: int | None,
+    previous_cancellations: int | None,
+) -> Any:
+    """Overbooking risk from the proxy table; repeat payloads are served by ``_cached_overbooking``."""
+    return lookup_overbooking_risk(
+        table=OVERBOOKING_FUT.result(),
+        bookings=BOOKINGS,
+        hotel_type=hotel_type,
+        arrival_month=arrival_month,
+        market_segment=market_segment,
+        is_repeated_guest=is_repeated_guest,
+        previous_cancellations=previous_cancellations,
+    )
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or value is pd.NA or value is pd.NaT or (isinstance(value, float) and value != value)
+
+
+def _records(frame: pd.DataFrame) -> list[dict]:
+    """Row dicts for a ranked frame; NaN in text columns becomes "" (orjson emits NaN floats as null)."""
+    cols = list(frame.columns)
+    text_cols = {i for i, c in enumerate(cols) if not pd.api.types.is_numeric_dtype(frame[c])}
+    if not text_cols:
+        return [dict(zip(cols, row)) for row in frame.itertuples(index=False, name=None)]
+    return [
+        {col: ("" if i in text_cols and _is_missing(v) else v) for i, (col, v) in enumerate(zip(cols, row))}
+        for row in frame.itertuples(index=False, name=None)
+    ]
+
+
+# Lookup endpoints are deterministic functions of their payload against the startup tables,
+# so identical requests are served from these LRU caches.
+RESPONSE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def _cached_cancellation(hotel_type: str | None, market_segment: str | None, lead_time: int | None) -> Any:
+    return _lookup_cancellation(hotel_type, market_segment, lead_time)
+
+
+@lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def _cached_overbooking(
+    hotel_type: str,
+    arrival_month: str,
+    market_segment: str | None,
+    is_repeated_guest: int | None,
+    previous_cancellations: int | None,
+) -> Any:
+    return _lookup_overbooking(hotel_type, arrival_month, market_segment, is_repeated_guest, previous_cancellations)
+
+
+@lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def _cached_price_fairness(hotel_type: str, arrival_month: str, current_price: float, hotel_class: float | None) -> Any:
+    return price_fairness(
+        expected_table=EXPECTED_ADR_FUT.result(),
+        hotel_type=hotel_type,
+        arrival_month=arrival_month,
+        current_price=current_price,
+        hotel_class=hotel_class,
+        class_base=DEFAULT_CONFIG.DEFAULT_CLASS_BASE,
+    )
+
+
+@lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def _cached_best_booking_window(hotel_type: str, arrival_month: str, min_samples: int) -> Any:
+    return best_booking_window(
+        window_table=BOOKING_WINDOW_FUT.result(),
+        hotel_type=hotel_type,
+        arrival_month=arrival_month,
+        min_bucket_n=min_samples,
+    )
+
+
+@lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def _cached_forecast_signal(city: str, hotel_class: float | None, check_in_date: str, horizon_days: int) -> Any:
+    return forecast_signal(
+        root=ROOT,
+        city=city,
+        hotel_class=hotel_class,
+        check_in_date=check_in_date,
+        horizon_days=horizon_days,
+    )
+
+
+def _payload_etag(key: tuple) -> str:
+    # hashlib rather than hash() so the tag is stable across workers and restarts; DATA_VERSION
+    # changes it whenever the source CSVs do.
+    return '"' + hashlib.sha1(repr((DATA_VERSION, key)).encode("utf-8")).hexdigest() + '"'
+
+
+# LOG_LEVEL (e.g. WARNING in production) overrides the default level from src.logger.
+if os.environ.get("LOG_LEVEL"):
+    try:
+        logger.setLevel(os.environ["LOG_LEVEL"].upper())
+    except ValueError:
+        logger.warning("Ignoring unknown LOG_LEVEL=%r, keeping the default level", os.environ["LOG_LEVEL"])
+
 # Load data at startup
 ROOT = get_project_root()
-logger.info(f"Loading data from {ROOT}")
+logger.info("Loading data from %s", ROOT)
+DERIVED_DIR = ROOT / "data" / "derived"
+BOOKINGS_SOURCES = (ROOT / "data" / "hotel_bookings.csv", ROOT / "hotel_bookings.csv")
+# Source file mtimes, mixed into response ETags so they change with the data.
+DATA_VERSION = tuple(
+    (p.name, p.stat().st_mtime_ns) for p in sorted({*ROOT.glob("*.csv"), *ROOT.glob("data/*.csv")})
+)
 
 try:
-    CANDIDATES, REVIEW_SUMMARY, BOOKINGS, CITIES = load_all_data(ROOT)
-    CANCELLATION_RISK_TABLE = compute_cancellation_risk_table(BOOKINGS)
-    OVERBOOKING_RISK_TABLE = compute_overbooking_proxy_table(BOOKINGS)
-    EXPECTED_ADR_TABLE = compute_expected_adr_table(BOOKINGS)
-    BOOKING_WINDOW_TABLE = compute_booking_window_table(BOOKINGS)
-    logger.info(f"Loaded {len(CANDIDATES)} candidates, {len(REVIEW_SUMMARY)} reviews, {len(BOOKINGS)} bookings")
+    CANDIDATES = None
+    if os.environ.get(SHM_ENV):
+        # Multi-worker mode: the launcher already loaded the data into shared memory.
+        try:
+            CANDIDATES, REVIEW_SUMMARY, BOOKINGS, CITIES = load_shared_data(os.environ[SHM_ENV])
+        except Exception as e:
+            logger.warning("Could not attach shared data, loading from disk: %s", e)
+    if CANDIDATES is None:
+        CANDIDATES, REVIEW_SUMMARY, BOOKINGS, CITIES = load_all_data(ROOT)
+
+    # Derived tables are built in the background so the worker can start serving right away;
+    # endpoints that need one await its future (only the first requests ever wait).
+    TABLE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tables")
+    CANCELLATION_FUT = TABLE_EXECUTOR.submit(_build_cancellation_state, BOOKINGS)
+    OVERBOOKING_FUT = TABLE_EXECUTOR.submit(_load_or_build, "overbooking_risk", compute_overbooking_proxy_table, BOOKINGS)
+    EXPECTED_ADR_FUT = TABLE_EXECUTOR.submit(_load_or_build, "expected_adr", compute_expected_adr_table, BOOKINGS)
+    BOOKING_WINDOW_FUT = TABLE_EXECUTOR.submit(_load_or_build, "booking_window", compute_booking_window_table, BOOKINGS)
+    for _fut in (CANCELLATION_FUT, OVERBOOKING_FUT, EXPECTED_ADR_FUT, BOOKING_WINDOW_FUT):
+        _fut.add_done_callback(_log_table_failure)
+
+    DEFAULT_HOTEL_TYPE = (
+        str(BOOKINGS["hotel"].mode().iloc[0])
+        if "hotel" in BOOKINGS.columns and not BOOKINGS["hotel"].dropna().empty
+        else None
+    )
+    # Exercise each payload validator once so the first real request takes the warm path.
+    for _model, _sample in (
+        (RecommendPayload, {"limit": 1}),
+        (ForecastSignalPayload, {"city": "", "check_in_date": "2000-01-01"}),
+        (CancellationRiskPayload, {"hotel_type": "", "market_segment": "", "lead_time": 0}),
+        (OverbookingRiskPayload, {"hotel_type": "", "arrival_month": ""}),
+        (PriceFairnessPayload, {"hotel_type": "", "arrival_month": "", "current_price": 0.0}),
+        (BestBookingWindowPayload, {"hotel_type": "", "arrival_month": ""}),
+        (BatchPayload, {"ops": [{"endpoint": "/recommend", "payload": {}}]}),
+    ):
+        _model.model_validate(_sample).model_dump()
+    logger.info("Loaded %d candidates, %d reviews, %d bookings", len(CANDIDATES), len(REVIEW_SUMMARY), len(BOOKINGS))
 except Exception as e:
-    logger.error(f"Failed to load data: {e}", exc_info=True)
+    logger.error("Failed to load data: %s", e, exc_info=True)
     raise
 
 
 @app.get("/health")
-def health() -> dict:
+async def health() -> dict:
     return {"status": "ok"}
 
 
 @app.get("/meta/cities")
-def meta_cities() -> dict:
+async def meta_cities() -> dict:
     """Get list of available cities."""
     try:
         if "city" not in CANDIDATES.columns:
             return {"count": 0, "cities": []}
         return {"count": len(CITIES), "cities": CITIES}
     except Exception as e:
-        logger.error(f"Error getting cities: {e}", exc_info=True)
+        logger.error("Error getting cities: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/meta/stats")
-def meta_stats() -> dict:
+async def meta_stats() -> dict:
     return {
         "candidates": int(len(CANDIDATES)),
         "review_summaries": int(len(REVIEW_SUMMARY)),
@@ -119,10 +442,10 @@ def meta_stats() -> dict:
 
 
 @app.post("/recommend")
-def recommend(payload: RecommendPayload) -> dict:
+async def recommend(payload: RecommendPayload) -> dict:
     """Get hotel recommendations based on criteria."""
     try:
-        logger.info(f"Recommendation request: city={payload.city}, budget={payload.budget}, limit={payload.limit}")
+        logger.info("Recommendation request: city=%s, budget=%s, limit=%s", payload.city, payload.budget, payload.limit)
         
         req = RecommendationRequest(
             city=payload.city,
@@ -134,7 +457,8 @@ def recommend(payload: RecommendPayload) -> dict:
             hotel_type=payload.hotel_type,
         )
 
-        ranked = recommend_explainable(
+        ranked = await run_in_threadpool(
+            recommend_explainable,
             candidates=CANDIDATES,
             review_summary=REVIEW_SUMMARY,
             req=req,
@@ -149,22 +473,15 @@ def recommend(payload: RecommendPayload) -> dict:
 
             # If hotel_type wasn't provided by the user, fall back to the most common booking "hotel" type.
             if hotel_type is None:
-                try:
-                    hotel_type = str(BOOKINGS["hotel"].mode().iloc[0])
-                except Exception:
-                    hotel_type = None
-
-            risk = lookup_cancellation_risk(
-                risk_table=CANCELLATION_RISK_TABLE,
-                hotel_type=hotel_type,
-                market_segment=market_segment,
-                lead_time=lead_time,
-            )
+                hotel_type = DEFAULT_HOTEL_TYPE
+
+            await _table_ready(CANCELLATION_FUT)
+            risk = _cached_cancellation(hotel_type, market_segment, lead_time)
             cancellation_risk = risk.__dict__ if risk is not None else None
 
-        records = ranked.fillna("").to_dict(orient="records")
+        records = _records(ranked)
         
-        logger.info(f"Returning {len(records)} recommendations")
+        logger.debug("Returning %d recommendations", len(records))
 
         return {
             "count": len(records),
@@ -172,72 +489,97 @@ def recommend(payload: RecommendPayload) -> dict:
             "cancellation_risk": cancellation_risk,
         }
     except Exception as e:
-        logger.error(f"Error in recommendation: {e}", exc_info=True)
+        logger.error("Error in recommendation: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/risk/cancellation")
-def risk_cancellation(payload: CancellationRiskPayload) -> dict:
-    risk = lookup_cancellation_risk(
-        risk_table=CANCELLATION_RISK_TABLE,
-        hotel_type=payload.hotel_type,
-        market_segment=payload.market_segment,
-        lead_time=payload.lead_time,
-    )
+async def risk_cancellation(payload: CancellationRiskPayload) -> dict:
+    await _table_ready(CANCELLATION_FUT)
+    risk = _cached_cancellation(payload.hotel_type, payload.market_segment, payload.lead_time)
     return {"result": risk.__dict__ if risk is not None else None}
 
 
 @app.post("/risk/overbooking")
-def risk_overbooking(payload: OverbookingRiskPayload) -> dict:
-    risk = lookup_overbooking_risk(
-        table=OVERBOOKING_RISK_TABLE,
-        bookings=BOOKINGS,
-        hotel_type=payload.hotel_type,
-        arrival_month=payload.arrival_month,
-        market_segment=payload.market_segment,
-        is_repeated_guest=payload.is_repeated_guest,
-        previous_cancellations=payload.previous_cancellations,
+async def risk_overbooking(payload: OverbookingRiskPayload) -> dict:
+    await _table_ready(OVERBOOKING_FUT)
+    risk = _cached_overbooking(
+        payload.hotel_type,
+        payload.arrival_month,
+        payload.market_segment,
+        payload.is_repeated_guest,
+        payload.previous_cancellations,
     )
     return {"result": risk.__dict__ if risk is not None else None}
 
 
 @app.post("/advice/price_fairness")
-def advice_price_fairness(payload: PriceFairnessPayload) -> dict:
-    res = price_fairness(
-        expected_table=EXPECTED_ADR_TABLE,
-        hotel_type=payload.hotel_type,
-        arrival_month=payload.arrival_month,
-        current_price=payload.current_price,
-        hotel_class=payload.hotel_class,
-        class_base=DEFAULT_CONFIG.DEFAULT_CLASS_BASE,
-    )
+async def advice_price_fairness(payload: PriceFairnessPayload) -> dict:
+    await _table_ready(EXPECTED_ADR_FUT)
+    res = _cached_price_fairness(payload.hotel_type, payload.arrival_month, payload.current_price, payload.hotel_class)
     return {"result": res.__dict__ if res is not None else None}
 
 
 @app.post("/advice/best_booking_window")
-def advice_best_booking_window(payload: BestBookingWindowPayload) -> dict:
-    res = best_booking_window(
-        window_table=BOOKING_WINDOW_TABLE,
-        hotel_type=payload.hotel_type,
-        arrival_month=payload.arrival_month,
-        min_bucket_n=int(payload.min_samples),
-    )
+async def advice_best_booking_window(payload: BestBookingWindowPayload) -> dict:
+    await _table_ready(BOOKING_WINDOW_FUT)
+    res = _cached_best_booking_window(payload.hotel_type, payload.arrival_month, int(payload.min_samples))
     return {"result": res.__dict__ if res is not None else None}
 
 
 @app.post("/forecast/signal")
-def forecast_signal_api(payload: ForecastSignalPayload) -> dict:
+async def forecast_signal_api(payload: ForecastSignalPayload, response: Response) -> dict:
     """Get price forecast signal for booking timing advice."""
     try:
-        logger.info(f"Forecast request: city={payload.city}, date={payload.check_in_date}")
-        sig = forecast_signal(
-            root=ROOT,
-            city=payload.city,
-            hotel_class=payload.hotel_class,
-            check_in_date=payload.check_in_date,
-            horizon_days=int(payload.horizon_days),
-        )
+        logger.info("Forecast request: city=%s, date=%s", payload.city, payload.check_in_date)
+        key = (payload.city, payload.hotel_class, payload.check_in_date, int(payload.horizon_days))
+        sig = await run_in_threadpool(_cached_forecast_signal, *key)
+        response.headers["ETag"] = _payload_etag(key)
         return {"result": sig.__dict__ if sig is not None else None}
     except Exception as e:
-        logger.error(f"Error in forecast: {e}", exc_info=True)
+        logger.error("Error in forecast: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
+
+
+async def _batch_forecast_signal(payload: ForecastSignalPayload) -> dict:
+    sig = await run_in_threadpool(
+        _cached_forecast_signal,
+        payload.city,
+        payload.hotel_class,
+        payload.check_in_date,
+        int(payload.horizon_days),
+    )
+    return {"result": sig.__dict__ if sig is not None else None}
+
+
+# endpoint path -> (payload model, handler) for /batch
+BATCH_HANDLERS = {
+    "/recommend": (RecommendPayload, recommend),
+    "/risk/cancellation": (CancellationRiskPayload, risk_cancellation),
+    "/risk/overbooking": (OverbookingRiskPayload, risk_overbooking),
+    "/advice/price_fairness": (PriceFairnessPayload, advice_price_fairness),
+    "/advice/best_booking_window": (BestBookingWindowPayload, advice_best_booking_window),
+    "/forecast/signal": (ForecastSignalPayload, _batch_forecast_signal),
+}
+
+
+async def _dispatch(op: BatchOp) -> dict:
+    if op.endpoint not in BATCH_HANDLERS:
+        return {"error": f"Unsupported endpoint: {op.endpoint}"}
+    model, handler = BATCH_HANDLERS[op.endpoint]
+    try:
+        return await handler(model.model_validate(op.payload))
+    except ValidationError as e:
+        return {"error": e.errors(include_url=False, include_context=False)}
+    except HTTPException as e:
+        return {"error": e.detail}
+    except Exception as e:
+        logger.error("Error in batch op %s: %s", op.endpoint, e, exc_info=True)
+        return {"error": str(e)}
+
+
+@app.post("/batch")
+async def batch(payload: BatchPayload) -> dict:
+    """Run several endpoint calls in one round-trip; results come back in request order."""
+    results = await asyncio.gather(*[_dispatch(op) for op in payload.ops])
+    return {"count": len(results), "results": list(results)}
@@ -0,0 +1,80 @@
+"""Share the loaded DataFrames between API worker processes through named shared memory.
+
+The parent process (``run_api.py``) loads the data once, writes each frame as an Arrow IPC
+stream into a ``SharedMemory`` block and exports the block prefix in ``TRAVELIQ_SHM_PREFIX``.
+Workers attach to the blocks by name instead of reading the CSVs again; numeric columns are
+mapped without copying, so their pages are shared by every worker.
+
+Opt-in via ``run_api.py --shared-data``: attached numeric arrays are read-only and missing
+strings come back as ``None`` rather than ``NaN``, which the ``src/`` code hasn't been
+checked against yet.
+"""
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+
+import pandas as pd
+import pyarrow as pa
+
+SHM_ENV = "TRAVELIQ_SHM_PREFIX"
+
+# Short block names: macOS caps shared memory names at 31 characters.
+_BLOCKS = ("cand", "rev", "book", "city")
+
+# Attached blocks must outlive the DataFrames viewing them.
+_ATTACHED: list[shared_memory.SharedMemory] = []
+
+
+def _publish_frame(name: str, df: pd.DataFrame) -> shared_memory.SharedMemory:
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    buf = sink.getvalue()
+
+    shm = shared_memory.SharedMemory(name=name, create=True, size=max(buf.size, 1))
+    shm.buf[: buf.size] = memoryview(buf).cast("B")
+    return shm
+
+
+def _attach_frame(name: str) -> pd.DataFrame:
+    # The parent owns and unlinks the block. Spawned workers share its resource tracker, so they
+    # must not unregister; on 3.13+ they skip tracking altogether.
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+    _ATTACHED.append(shm)
+    table = pa.ipc.open_stream(pa.py_buffer(shm.buf)).read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+def publish_data(
+    prefix: str,
+    candidates: pd.DataFrame,
+    review_summary: pd.DataFrame,
+    bookings: pd.DataFrame,
+    cities: list[str],
+) -> list[shared_memory.SharedMemory]:
+    """Write the output of ``load_all_data`` to shared memory; the caller must unlink the blocks."""
+    frames = (candidates, review_summary, bookings, pd.DataFrame({"city": list(cities)}))
+    blocks: list[shared_memory.SharedMemory] = []
+    try:
+        for block, df in zip(_BLOCKS, frames):
+            blocks.append(_publish_frame(f"{prefix}_{block}", df))
+    except Exception:
+        release(blocks)
+        raise
+    return blocks
+
+
+def load_shared_data(prefix: str) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, list[str]]:
+    """Attach to blocks written by ``publish_data``; same shape as ``load_all_data``."""
+    candidates, review_summary, bookings, cities = (_attach_frame(f"{prefix}_{block}") for block in _BLOCKS)
+    return candidates, review_summary, bookings, cities["city"].tolist()
+
+
+def release(blocks: list[shared_memory.SharedMemory]) -> None:
+    for shm in blocks:
+        shm.close()
+        shm.unlink()
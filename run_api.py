@@ -1,4 +1,6 @@
 """Start the FastAPI server."""
+import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -9,6 +11,48 @@ sys.path.insert(0, str(project_root))
 import uvicorn
 
 if __name__ == "__main__":
-    print("Starting FastAPI server on http://127.0.0.1:8000")
+    parser = argparse.ArgumentParser(description="Start the FastAPI server.")
+    parser.add_argument("--host", default=os.environ.get("TRAVEL_API_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("TRAVEL_API_PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--dev", action="store_true", help="Single worker with auto-reload")
+    parser.add_argument(
+        "--shared-data",
+        action="store_true",
+        help="Load data once and share it with workers via shared memory (experimental: frames are read-only)",
+    )
+    args = parser.parse_args()
+
+    print(f"Starting FastAPI server on http://{args.host}:{args.port}")
     print("Press Ctrl+C to stop")
-    uvicorn.run("api.app:app", host="127.0.0.1", port=8000, reload=True)
+    if args.dev:
+        uvicorn.run("api.app:app", host=args.host, port=args.port, reload=True)
+    else:
+        workers = args.workers or os.cpu_count() or 1
+        blocks = []
+        if args.shared_data and workers > 1:
+            # Load the data once here and let every worker attach to it instead of re-reading the CSVs.
+            from api.shared_tables import SHM_ENV, publish_data, release
+            from src.data_loader import load_all_data
+            from src.utils import get_project_root
+
+            prefix = f"tiq{os.getpid()}"
+            try:
+                blocks = publish_data(prefix, *load_all_data(get_project_root()))
+                os.environ[SHM_ENV] = prefix
+            except Exception as e:
+                print(f"Shared memory unavailable, workers will load data themselves: {e}")
+        try:
+            # "auto" picks uvloop and httptools when installed and falls back to asyncio/h11 (e.g. on Windows).
+            uvicorn.run(
+                "api.app:app",
+                host=args.host,
+                port=args.port,
+                workers=workers,
+                loop="auto",
+                http="auto",
+                log_level="warning",
+            )
+        finally:
+            if blocks:
+                release(blocks)
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-import json
 from pathlib import Path
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
 
+import httpx
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -19,27 +18,22 @@ st.set_page_config(page_title="Hotel Optimizer", layout="wide", initial_sidebar_
 root = get_project_root()
 
 
+@st.cache_resource(show_spinner=False)
+def _get_http_client(base_url: str) -> httpx.Client:
+    """Keep-alive client shared across reruns, one per API base URL."""
+    return httpx.Client(base_url=base_url.rstrip("/"), timeout=30)
+
+
 def _post_json(base_url: str, path: str, payload: dict) -> dict:
     url = base_url.rstrip("/") + path
-    req = Request(
-        url=url,
-        data=json.dumps(payload).encode("utf-8"),
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
-
     try:
-        with urlopen(req, timeout=30) as resp:
-            raw = resp.read().decode("utf-8")
-            return json.loads(raw) if raw else {}
-    except HTTPError as e:
-        try:
-            body = e.read().decode("utf-8")
-        except Exception:
-            body = ""
-        raise RuntimeError(f"HTTP {e.code} calling {url}: {body or e.reason}")
-    except URLError as e:
-        raise RuntimeError(f"Network error calling {url}: {e.reason}")
+        resp = _get_http_client(base_url).post(path, json=payload)
+    except httpx.RequestError as e:
+        raise RuntimeError(f"Network error calling {url}: {e}")
+
+    if resp.is_error:
+        raise RuntimeError(f"HTTP {resp.status_code} calling {url}: {resp.text or resp.reason_phrase}")
+    return resp.json() if resp.content else {}
 
 # Load data with caching
 @st.cache_data(show_spinner=False)
@@ -49,7 +43,7 @@ def load_data_cached(project_root: Path) -> tuple[pd.DataFrame, pd.DataFrame, li
         candidates, review_summary, _, cities = load_all_data(project_root)
         return candidates, review_summary, cities
     except Exception as e:
-        logger.error(f"Error loading data: {e}", exc_info=True)
+        logger.error("Error loading data: %s", e, exc_info=True)
         st.error(f"Error loading data: {e}")
         raise
 
@@ -60,19 +54,35 @@ def load_bookings_cached(project_root: Path) -> pd.DataFrame:
     try:
         return load_hotel_bookings(project_root)
     except Exception as e:
-        logger.error(f"Error loading bookings: {e}", exc_info=True)
+        logger.error("Error loading bookings: %s", e, exc_info=True)
         st.error(f"Error loading bookings: {e}")
         raise
 
 
+def _sorted_unique(df: pd.DataFrame, col: str) -> list[str]:
+    if col not in df.columns:
+        return []
+    return np.sort(pd.unique(df[col].dropna().to_numpy())).tolist()
+
+
+@st.cache_resource(show_spinner=False)
+def dropdown_options_cached(project_root: Path) -> dict[str, list[str]]:
+    """Build dropdown option lists once per process."""
+    bookings = load_bookings_cached(project_root)
+    return {
+        "hotel_types": _sorted_unique(bookings, "hotel"),
+        "market_segments": _sorted_unique(bookings, "market_segment"),
+    }
+
+
 # Load data
 try:
     candidates, review_summary, cities = load_data_cached(root)
-    bookings = load_bookings_cached(root)
-    
+
     # Get unique values for dropdowns
-    hotel_types = sorted(bookings["hotel"].dropna().unique().tolist()) if "hotel" in bookings.columns else []
-    market_segments = sorted(bookings["market_segment"].dropna().unique().tolist()) if "market_segment" in bookings.columns else []
+    dropdown_options = dropdown_options_cached(root)
+    hotel_types = dropdown_options["hotel_types"]
+    market_segments = dropdown_options["market_segments"]
     months = ["January", "February", "March", "April", "May", "June",
               "July", "August", "September", "October", "November", "December"]
 except Exception as e:
@@ -108,6 +118,16 @@ if feature == "Hotel Recommendations":
         adults = st.number_input("Adults", min_value=0, value=2, step=1)
     
     limit = st.slider("Number of Results", min_value=1, max_value=30, value=10)
+
+    include_risk = st.checkbox("Include Cancellation Risk")
+    if include_risk:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            rec_hotel_type = st.selectbox("Hotel Type", options=[""] + hotel_types)
+        with col2:
+            rec_market_segment = st.selectbox("Market Segment", options=[""] + market_segments)
+        with col3:
+            rec_lead_time = st.number_input("Lead Time (days)", min_value=0, value=30, step=1)
     
     if st.button("Get Recommendations", type="primary", use_container_width=True):
         with st.spinner("Finding best hotels..."):
@@ -119,12 +139,43 @@ if feature == "Hotel Recommendations":
                 "limit": int(limit),
             }
 
+            want_risk = include_risk and bool(rec_hotel_type) and bool(rec_market_segment)
+            if include_risk and not want_risk:
+                st.warning("Select hotel type and market segment to include cancellation risk")
+
+            risk_resp = None
             try:
-                resp = _post_json(api_base_url, "/recommend", payload)
+                if want_risk:
+                    # One round-trip for recommendations and risk together.
+                    risk_payload = {
+                        "hotel_type": rec_hotel_type,
+                        "market_segment": rec_market_segment,
+                        "lead_time": int(rec_lead_time),
+                    }
+                    batch = _post_json(api_base_url, "/batch", {"ops": [
+                        {"endpoint": "/recommend", "payload": payload},
+                        {"endpoint": "/risk/cancellation", "payload": risk_payload},
+                    ]})
+                    resp, risk_resp = batch.get("results", [{}, {}])
+                    if "error" in resp:
+                        raise RuntimeError(str(resp["error"]))
+                else:
+                    resp = _post_json(api_base_url, "/recommend", payload)
             except Exception as e:
                 st.error(str(e))
                 st.stop()
 
+            if want_risk:
+                risk = risk_resp.get("result") if isinstance(risk_resp, dict) else None
+                if risk:
+                    cancellation_rate = float(risk.get("cancellation_rate", 0.0))
+                    st.metric("Cancellation Rate", f"{cancellation_rate * 100:.1f}%")
+                    st.caption(str(risk.get("advice", "")))
+                elif isinstance(risk_resp, dict) and "error" in risk_resp:
+                    st.warning(f"Could not compute cancellation risk: {risk_resp['error']}")
+                else:
+                    st.warning("Could not compute cancellation risk. Try different values.")
+
             results = resp.get("results") if isinstance(resp, dict) else None
             if results:
                 df = pd.DataFrame(results)